@@ -31,8 +31,7 @@ I can update existing (or add new) parameters in bulk:
 
 ```python
 >>> cm.update_params(submitter="sequoiac")
->>> for cir in cm:
-...    cir.loc += (0, 127)
+>>> cm.translate(0, 127)
 
 >>> cm.update_params(ports="LD")
 ```
@@ -60,8 +59,7 @@ entire GDS fild by copying CircuitMaps and adjusting its parameters.
 ...     print(len(group))
 ...     grouping = str(i + 1)
 ...     group.update_params(grouping=grouping)
-...     for cir in group:
-...         cir.loc += offsets[grouping]
+...     group.translate(*offsets[grouping])
 ```
 
 I can then combine all the groups into a single CircuitMap:
@@ -81,7 +79,10 @@ in automated tests.
 """
 from __future__ import annotations
 import copy
+import json
 import logging
+import re
+import sys
 import time
 import numpy as np
 from pathlib import Path
@@ -90,12 +91,84 @@ from gdstk import Polygon
 from collections import defaultdict
 import matplotlib.pyplot as plt
 
-from autogator.errors import CircuitMapUniqueKeyError
+from autogator.errors import CircuitMapKeyError, CircuitMapUniqueKeyError
 import gdsfactory as gf
 from gdsfactory import Component
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 log = logging.getLogger(__name__)
 
+# Circuit file lines look like "(x, y) key1=value1, key2=value 2, ..."
+_LOC_RE = re.compile(r"\(\s*([-+0-9.eE]+)\s*,\s*([-+0-9.eE]+)\s*\)\s*(.*)")
+_PARAM_RE = re.compile(r"\s*([^=,]+?)\s*=\s*([^,]*?)\s*(?:,|$)")
+
+
+# Cell size (GDS units) of the polygon lookup grid used by loadGDS. Roughly
+# matches the search windows used when grouping polygons into circuits.
+_GRID_CELL_SIZE = 500.0
+
+
+class _BoundingBoxGrid:
+    """
+    Uniform grid over polygon bounding boxes for fast rectangular queries.
+
+    Each polygon is registered in every cell its bounding box overlaps, so a
+    query only has to look at the polygons in the cells it covers instead of
+    scanning every polygon.
+
+    Parameters
+    ----------
+    bboxes : np.ndarray
+        (N, 4) array of ``[xmin, ymin, xmax, ymax]`` rows.
+    cellSize : float
+        Width and height of each grid cell.
+    indices : np.ndarray, optional
+        Rows of ``bboxes`` to register. Defaults to all of them. Query results
+        are always row numbers of ``bboxes``.
+    """
+    def __init__(self, bboxes: np.ndarray, cellSize: float = _GRID_CELL_SIZE, indices: np.ndarray = None) -> None:
+        self.bboxes = bboxes
+        self.cellSize = cellSize
+        self.cells = defaultdict(list)
+        if indices is None:
+            indices = np.arange(len(bboxes))
+        if len(indices) == 0:
+            self.origin = np.zeros(2)
+            self.maxCell = np.zeros(2, dtype=int)
+            return
+        boxes = bboxes[indices]
+        self.origin = boxes[:, :2].min(axis=0)
+        lo = np.floor((boxes[:, :2] - self.origin) / cellSize).astype(int)
+        hi = np.floor((boxes[:, 2:] - self.origin) / cellSize).astype(int)
+        self.maxCell = hi.max(axis=0)
+        for index, (x0, y0), (x1, y1) in zip(indices.tolist(), lo.tolist(), hi.tolist()):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self.cells[(cx, cy)].append(index)
+
+    def _cellRange(self, lo: float, hi: float, axis: int) -> range:
+        bounds = (np.array([lo, hi]) - self.origin[axis]) / self.cellSize
+        start, stop = np.floor(np.clip(bounds, 0, self.maxCell[axis])).astype(int)
+        return range(start, stop + 1)
+
+    def query(self, xmin: float, ymin: float, xmax: float, ymax: float) -> np.ndarray:
+        """
+        Returns the sorted indices of the bounding boxes that intersect the
+        given box. Bounds may be infinite.
+        """
+        found = set()
+        for cx in self._cellRange(xmin, xmax, 0):
+            for cy in self._cellRange(ymin, ymax, 1):
+                found.update(self.cells.get((cx, cy), ()))
+        indices = np.fromiter(found, dtype=np.intp, count=len(found))
+        indices.sort()
+        b = self.bboxes[indices]
+        hit = (b[:, 0] <= xmax) & (b[:, 2] >= xmin) & (b[:, 1] <= ymax) & (b[:, 3] >= ymin)
+        return indices[hit]
+
 
 class Location(NamedTuple):
     """
@@ -128,29 +201,20 @@ class Location(NamedTuple):
         """
         Locations can be added to other Locations or tuples of length 2.
         """
-        if isinstance(o, Location):
-            return Location(self.x + o.x, self.y + o.y)
-        elif isinstance(o, tuple) and len(o) == 2:
-            return Location(self.x + o[0], self.y + o[1])
-        else:
+        if not isinstance(o, tuple):
             raise TypeError("Cannot add Location to " + str(type(o)))
+        try:
+            dx, dy = o
+        except ValueError:
+            raise TypeError("Cannot add Location to " + str(type(o))) from None
+        return Location(self.x + dx, self.y + dy)
 
-    def __eq__(self, o: object) -> bool:
-        """
-        Locations can be compared to other Locations or tuples of length 2.
-        """
-        if isinstance(o, Location):
-            return self.x == o.x and self.y == o.y
-        elif isinstance(o, tuple) and len(o) == 2:
-            return self.x == o[0] and self.y == o[1]
-        else:
-            return False
-
+    # Locations are immutable, so copies can share the original.
     def __copy__(self) -> Location:
-        return Location(self.x, self.y)
+        return self
 
     def __deepcopy__(self, memodict: Dict[Any, Any]) -> Location:
-        return Location(self.x, self.y)
+        return self
 
 class PortType:
     def __init__(self, location: Location) -> None:
@@ -196,16 +260,10 @@ class Circuit:
         self._loc = loc
 
     def __str__(self) -> str:
-        output = f"({self.loc.x},{self.loc.y}) "
-        for key, val in self.params.items():
-            output += f"{key}={val}, "
-        if self.params:
-            output = output[:-2]
-        return output
+        params = ", ".join(f"{key}={val}" for key, val in self.params.items())
+        return f"({self.loc.x!s},{self.loc.y!s}) " + params
 
     def __getitem__(self, key: str) -> str:
-        if not isinstance(key, str):
-            raise TypeError("Parameter name must be a string")
         return self.params[key]
 
     def __setitem__(self, name: str, value: Any) -> None:
@@ -213,23 +271,17 @@ class Circuit:
             raise TypeError("Parameter name must be a string")
         self.params[name] = value
 
-    def __getattr__(self, key: str) -> str:
-        if not isinstance(key, str):
-            raise TypeError("Parameter name must be a string")
-        try:
-            return self.params[key]
-        except KeyError as exc:
-            raise AttributeError(f"circuit has no attribute '{key}'") from exc
-
     def __copy__(self) -> Circuit:
         return Circuit(self.loc, self.params.copy())
 
     def __deepcopy__(self, memodict: Dict[Any, Any]) -> "Circuit":
-        newOne = Circuit(
-            copy.deepcopy(self.loc, memodict),
-            copy.deepcopy(self.params, memodict),
-        )
-        return newOne
+        # Locations and string values are immutable and can be shared; only
+        # other values (e.g. polygons and ports from loadGDS) are deep copied.
+        params = {
+            key: val if isinstance(val, str) else copy.deepcopy(val, memodict)
+            for key, val in self.params.items()
+        }
+        return Circuit(self.loc, params)
 
 
 class CircuitMap:
@@ -250,25 +302,27 @@ class CircuitMap:
     >>> cmap[0]
     >>> cmap[Location(0, 0)]
     >>> cmap[(0, 0)]
+
+    Looking up a location with no circuit raises ``CircuitMapKeyError``.
     """
 
-    def __init__(self, circuits: List[Circuit] = []) -> None:
-        self.circuits = circuits
+    def __init__(self, circuits: List[Circuit] = None) -> None:
+        self.circuits = list(circuits) if circuits is not None else []
 
     def __getitem__(self, key: Union[int, Location, Tuple[int, int]]) -> Circuit:
-        if isinstance(key, int):
-            return self.circuits[key]
-        elif isinstance(key, Location):
+        # Integer indexing is the common case; let the list reject other keys.
+        try:
+            circuit = self.circuits[key]
+        except TypeError:
+            pass
+        else:
+            return CircuitMap(circuit) if type(key) is slice else circuit
+        # Locations are tuples, so both compare equal to the stored loc.
+        if isinstance(key, tuple) and len(key) == 2:
             for circuit in self.circuits:
                 if circuit.loc == key:
                     return circuit
-        elif isinstance(key, tuple) and len(key) == 2:
-            for circuit in self.circuits:
-                if circuit.loc == Location(key[0], key[1]):
-                    return circuit
-        # TODO: Implement slicing?
-        # elif isinstance(key, slice):
-        #     return CircuitMap(self.circuits[key])
+            raise CircuitMapKeyError(f"No circuit at location {key}")
         else:
             raise TypeError(f"Invalid key type '{type(key)}'")
 
@@ -277,30 +331,43 @@ class CircuitMap:
         Adds two CircuitMaps together. Does not modify the original CircuitMap.
         """
         if isinstance(o, CircuitMap):
-            circuits = self.circuits
+            circuits = list(self.circuits)
+            seen = {circuit.loc for circuit in circuits}
             for circuit in o.circuits:
-                if circuit not in circuits:
+                if circuit.loc not in seen:
                     circuits.append(circuit)
+                    seen.add(circuit.loc)
             return CircuitMap(circuits)
         else:
             raise TypeError(f"Cannot add {type(o)} to CircuitMap")
 
     def __str__(self) -> str:
-        string = "[\n"
-        for circuit in self.circuits:
-            string += " " + str(circuit) + "\n"
-        string += "]"
-        return string
+        return "[\n" + "".join(f" {circuit}\n" for circuit in self.circuits) + "]"
 
     def __len__(self) -> int:
         return len(self.circuits)
 
+    @property
+    def locations(self) -> np.ndarray:
+        """
+        The locations of all circuits as an (N, 2) array of (x, y) rows.
+
+        The array is a snapshot in circuit order; modifying it does not move
+        the circuits.
+        """
+        locs = np.fromiter(
+            (coord for circuit in self.circuits for coord in circuit.loc),
+            dtype=np.float64,
+            count=2 * len(self.circuits),
+        )
+        return locs.reshape(-1, 2)
+
     def __copy__(self) -> CircuitMap:
         return CircuitMap(self.circuits)
 
     def __deepcopy__(self, memo: Any) -> CircuitMap:
         newOne = type(self)()
-        newOne.circuits = [copy.deepcopy(circuit) for circuit in self.circuits]
+        newOne.circuits = [circuit.__deepcopy__(memo) for circuit in self.circuits]
         return newOne
 
     def filterby(self, **kwargs: str) -> CircuitMap:
@@ -325,13 +392,11 @@ class CircuitMap:
         >>> cmap = CircuitMap.loadtxt("./sample.txt")
         >>> filtered = cmap.filterby(name="MZI1")
         """
-        haskeys = [
+        items = tuple(kwargs.items())
+        filtered = [
             c
             for c in self.circuits
-            if all(hasattr(c, key) for key in kwargs.keys())
-        ]
-        filtered = [
-            c for c in haskeys if all(c[key] == val for key, val in kwargs.items())
+            if all(key in c.params and c.params[key] == val for key, val in items)
         ]
         return CircuitMap(filtered)
 
@@ -357,12 +422,12 @@ class CircuitMap:
         >>> cmap = CircuitMap.loadtxt("./sample.txt")
         >>> filtered = cmap.filterout(name="MZI1")
         """
-        filtered = []
-        for circuit in self.circuits:
-            overlap = set(circuit.params.keys()).intersection(set(kwargs.keys()))
-            if any(circuit[key] == kwargs[key] for key in overlap):
-                continue
-            filtered.append(circuit)
+        items = tuple(kwargs.items())
+        filtered = [
+            c
+            for c in self.circuits
+            if not any(key in c.params and c.params[key] == val for key, val in items)
+        ]
         return CircuitMap(filtered)
 
     def update_params(self, **kwargs) -> None:
@@ -376,14 +441,41 @@ class CircuitMap:
         **kwargs : dict
             The key, value pairs to update the circuits with.
         """
+        kwargs = {
+            key: sys.intern(value) if type(value) is str else value
+            for key, value in kwargs.items()
+        }
         for circuit in self.circuits:
-            for key, value in kwargs.items():
-                circuit.params[key] = value
+            circuit.params.update(kwargs)
+
+    def translate(self, dx: float, dy: float) -> None:
+        """
+        Shifts the location of every circuit in the CircuitMap.
+
+        Equivalent to ``circuit.loc += (dx, dy)`` for each circuit, but the
+        offset is applied to all locations at once.
+
+        Parameters
+        ----------
+        dx : float
+            The offset to add to each x coordinate.
+        dy : float
+            The offset to add to each y coordinate.
+        """
+        if not self.circuits:
+            return
+        locs = self.locations
+        locs += (dx, dy)
+        for circuit, (x, y) in zip(self.circuits, locs.tolist()):
+            circuit.loc = Location(x, y)
 
     def savetxt(self, path: Union[str, Path]) -> None:
         """
         Saves the circuit map to a text file.
 
+        The file is written one circuit per line in the format read by
+        ``loadtxt``.
+
         Parameters
         ----------
         path : str, Path
@@ -391,7 +483,64 @@ class CircuitMap:
         """
         path = Path(path)
         with path.open("w") as f:
-            f.write(str(self))
+            f.writelines(f"{circuit}\n" for circuit in self.circuits)
+
+    def savejson(self, path: Union[str, Path]) -> None:
+        """
+        Saves the circuit map to a JSON file.
+
+        Faster to write and read back than ``savetxt`` for large maps. Uses
+        ``orjson`` if it is installed, otherwise the standard library.
+        Parameter values must be JSON serializable.
+
+        Parameters
+        ----------
+        path : str, Path
+            File path to save the JSON file.
+        """
+        data = [[c.loc.x, c.loc.y, c.params] for c in self.circuits]
+        if orjson is not None:
+            content = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            content = json.dumps(data).encode()
+        Path(path).write_bytes(content)
+
+    @classmethod
+    def loadjson(cls, filename: Union[str, Path]) -> CircuitMap:
+        """
+        Loads a circuit map saved with ``savejson``.
+
+        Parameters
+        ----------
+        filename : str or Path
+            Name of the file to load.
+
+        Returns
+        -------
+        CircuitMap
+            CircuitMap containing the circuits in the file.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file does not exist.
+        CircuitMapUniqueKeyError
+            If two circuits share a location.
+        """
+        filename = Path(filename)
+        if not filename.exists():
+            raise FileNotFoundError(f"File '{filename}' does not exist")
+        content = filename.read_bytes()
+        data = orjson.loads(content) if orjson is not None else json.loads(content)
+        circuits = []
+        circuitLocs = set()
+        for x, y, params in data:
+            loc = Location(x, y)
+            if loc in circuitLocs:
+                raise CircuitMapUniqueKeyError(f"Duplicate location not allowed {loc}")
+            circuitLocs.add(loc)
+            circuits.append(Circuit(loc, params))
+        return cls(circuits)
 
     @staticmethod
     def polygonsBoundingBox(polygons):
@@ -427,74 +576,6 @@ class CircuitMap:
 
 
     
-    @classmethod
-    def _walkBack(self, startPoly, allGrates, pastComponents=[]):
-        output = None
-        if len(pastComponents) > 7:
-            return output, pastComponents
-        # if len(pastComponents) == 0:
-            # plt.ion()
-            # plt.show()
-            # plt.clf()
-            # plt.plot(*zip(*startPoly.points))
-
-        allPolygons = self.allPolygons
-        set1 = set(allPolygons)
-        set2 = set(pastComponents)
-        set3 = set([startPoly])
-        allPolygons = list(set1-set2-set3)
-        simplifiedPolygons = [poly for poly in allPolygons
-                        if abs(poly.bounding_box()[0][0] - startPoly.bounding_box()[0][0]) <= 1500
-                        and abs(poly.bounding_box()[0][1] - startPoly.bounding_box()[0][1]) <= 1500]
-
-        # Find a line that we want to attach polygons to
-        sharedPolys = [poly for poly in simplifiedPolygons if startPoly.contain_any(*poly.points)]
-        sharedPoints = [point for poly in sharedPolys for point, isContained in zip(poly.points, startPoly.contain(*poly.points)) if isContained]
-
-        for index, startPoint in enumerate(startPoly.points):
-            if len(sharedPoints) == 0:
-                break
-            if not (startPoint == sharedPoints).any():
-                continue
-            if index >= len(startPoly.points):
-                # Backup a polygon
-                break
-            if index == len(startPoly.points)-1:
-                index = -1
-            line1Distance = np.linalg.norm(startPoint - startPoly.points[index+1])
-            line2Distance = np.linalg.norm(startPoint - startPoly.points[index-1])
-            if line1Distance < .4 and line2Distance < .4:
-                continue
-            if line1Distance > 11 and line2Distance > 11:
-                continue
-            if len(pastComponents) > 0:
-                if any(np.array_equal(startPoint, pastPoint) for pastPoint in pastComponents[-1].points):
-                    continue
-
-            for index, componentPoly in enumerate(sharedPolys):
-                # plt.clf()
-                # for item in pastComponents:
-                #     plt.plot(*zip(*item.points))
-                # plt.plot(*zip(*componentPoly.points))
-                # plt.draw()
-                # plt.pause(0.001)
-
-                pastComponents.append(startPoly)
-                if componentPoly in allGrates:
-                    output = componentPoly
-                    # plt.close()
-                    break
-                result, _ = self._walkBack(componentPoly, allGrates, pastComponents)
-                if result is None:
-                    if len(pastComponents) > 7:
-                        break
-                    continue
-                pastComponents.append(result)
-                output = result
-                break
-        return output, pastComponents
-
-
     @classmethod
     def _sidewaySearch(self, startGrate, vGroveSeparation) -> List[Polygon]:
         """Will look to the next grating coupler in self.gratingCouplers and then see if the spacing is correct 
@@ -506,24 +587,29 @@ class CircuitMap:
 
         """        
         # Find the grating couplers at the same y height as startGrate
-        startGrateCenter = self.boundingBoxCenter(startGrate)
-        sameHeight = [grate for grate in self.gratingCouplers 
-                      if self.boundingBoxCenter(grate)[1] == startGrateCenter[1]
-                      and grate is not startGrate]
+        startIndex = self._grateIndex[id(startGrate)]
+        sameHeight = np.array(self._grateRows[self._polyCenter(startGrate)[1]], dtype=np.intp)
+        sameHeight = sameHeight[self._grateAlive[sameHeight] & (sameHeight != startIndex)]
+        # A coupler is in the circuit if it is a whole number of v-groove
+        # separations (at most one per coupler in the row) to either side.
+        startX = self._grateX[startIndex]
+        offsets = np.abs(self._grateX[sameHeight] - startX)
+        step = abs(vGroveSeparation)
+        units = offsets // step
+        matched = (offsets % step == 0) & (units >= 1) & (units <= len(sameHeight))
         circuitCouplers = [startGrate]
+        takenX = {startX}
         maxSeparation = 0
-        for grate in sameHeight:
-            nextGrateCenter = self.boundingBoxCenter(grate)
-            for x in range(1,len(sameHeight)+1):
-                if (round(startGrateCenter[0]) + (vGroveSeparation * x) == round(nextGrateCenter[0])
-                or round(startGrateCenter[0]) - (vGroveSeparation * x) == round(nextGrateCenter[0])):
-                    # Remove any duplicate polygons
-                    if any(poly for poly in circuitCouplers if round(self.boundingBoxCenter(poly)[0]) == round(nextGrateCenter[0])):
-                        self.gratingCouplers.remove(grate)
-                    else:
-                        maxSeparation = x
-                        circuitCouplers.append(grate)
-                    break        
+        for index, x in zip(sameHeight[matched].tolist(), units[matched].astype(int).tolist()):
+            grate = self.gratingCouplers[index]
+            nextX = self._grateX[index]
+            # Remove any duplicate polygons
+            if nextX in takenX:
+                self._removeCoupler(grate)
+            else:
+                maxSeparation = x
+                circuitCouplers.append(grate)
+                takenX.add(nextX)
         return circuitCouplers, maxSeparation    
 
     def polygonSearchGDS(self, polygonPoints: int) -> list:
@@ -535,22 +621,28 @@ class CircuitMap:
         Returns:
             list: A list of polygons that match the search criteria.
         """        
-        matches = []
-        for index, polygon in enumerate(self.allPolygons):
-            if len(polygon.points) != polygonPoints:
-                continue
-            x, y = zip(*polygon.points)
-            if not (max(abs(point - x[index-1]) for index, point in enumerate(x)) > 4):
-                continue
-            if not max(abs(point - y[index-1]) for index, point in enumerate(y)) > 13:
-                continue
-            matches.append(polygon)
-        return matches
+        candidates = [self.allPolygons[index] for index in self._byPointCount.get(polygonPoints, []) if self._alive[index]]
+        if not candidates:
+            return []
+        pts = np.array([polygon.points for polygon in candidates], dtype=np.float64)
+        # Largest step between consecutive points, wrapping from the last
+        # point back to the first.
+        steps = np.abs(pts - np.roll(pts, 1, axis=1)).max(axis=1)
+        mask = (steps[:, 0] > 4) & (steps[:, 1] > 13)
+        return [polygon for polygon, match in zip(candidates, mask.tolist()) if match]
 
     @staticmethod
     def boundingBoxCenter(polygon):
         box = polygon.bounding_box()
         return ((box[1][0] + box[0][0])/2, (box[1][1] + box[0][1])/2)
+
+    @classmethod
+    def _polyCenter(self, polygon) -> Tuple[float, float]:
+        """
+        Bounding box center of a polygon loaded by ``loadGDS``, looked up from
+        the centers cached at load time.
+        """
+        return self._centers[self._polyIndex[id(polygon)]]
     
     @classmethod
     def graphCircuit(self, circuitPolys):
@@ -565,15 +657,15 @@ class CircuitMap:
     
     @classmethod
     def _createNewCircuit(self, vGroveSpacing, vGrovePorts, circuitCouplers, circuitPolygons=[]) -> Circuit:
-        newCircuit = Circuit(self.boundingBoxCenter(circuitCouplers[0]), {'polygons': circuitPolygons})
-        outputs = [Location(*self.boundingBoxCenter(poly)) for poly in circuitCouplers[1:]]
+        newCircuit = Circuit(self._polyCenter(circuitCouplers[0]), {'polygons': circuitPolygons})
+        outputs = [Location(*self._polyCenter(poly)) for poly in circuitCouplers[1:]]
         self._setCircuitPorts(newCircuit, vGroveSpacing, vGrovePorts, outputs)
         return newCircuit
     
     @classmethod
     def _getCircuitPolygons(self, circuitCouplers) -> List[Polygon]:
         # Get all the points of the bounding boxes of every coupler
-        circuitPoints = [point for poly in circuitCouplers for point in poly.bounding_box()]
+        circuitPoints = [point for poly in circuitCouplers for point in self._polyBounds(poly)]
         # Find minX minY maxX and maxY
         minX, minY = np.min(circuitPoints, axis=0)
         maxX, maxY = np.max(circuitPoints, axis=0)
@@ -583,82 +675,125 @@ class CircuitMap:
         
         # Simplify the self.allPolygons into a variable called simplifiedPolys that contains the polygons that are 
         # within 1500 units of the box
-        simplifiedPolys = [(poly, index) for index, poly in enumerate(self.allPolygons)
-                        if poly.bounding_box()[1][0] <= maxX+400
-                        and poly.bounding_box()[0][0] >= minX - 400
-                        and poly.bounding_box()[0][1] >= minY-50]
+        nearby = self._grid.query(minX - 400, minY - 50, maxX + 400, np.inf)
+        nearby = nearby[self._alive[nearby]]
+        bbox = self._bbox[nearby]
+        nearby = nearby[(bbox[:, 2] <= maxX + 400) & (bbox[:, 0] >= minX - 400) & (bbox[:, 1] >= minY - 50)]
+        simplifiedPolys = [(self.allPolygons[index], index) for index in nearby.tolist()]
+        bbox = self._bbox[nearby]
         # See what polygons are inside the box and then continuously find the bounding box of those 
         # polygons until changing the bounding box stops adding polygons to the circuit
         while True:
-            maxX = box[1][0]
-            minX = box[0][0]
-            maxY = box[1][1]
-            minY = box[0][1]
-            circuitPolygons = [poly for poly in simplifiedPolys 
-                                if (poly[0].bounding_box()[1][0] <= maxX
-                                and poly[0].bounding_box()[1][1] <= maxY
-                                and poly[0].bounding_box()[1][0] >= minX
-                                and poly[0].bounding_box()[1][1] >= minY)
-                                
-                                or (poly[0].bounding_box()[0][0] >= minX
-                                and poly[0].bounding_box()[0][1] >= minY
-                                and poly[0].bounding_box()[0][0] <= maxX
-                                and poly[0].bounding_box()[0][1] <= maxY)
-                                ]
-            # test = [(poly, index) for index, poly in enumerate(self.allPolygons) if self.isInside(poly, box)]
-            # if len(test) != len(circuitPolygons):
-            #     print('no')
-            if len(circuitPolygons) == 0:
+            (minX, minY), (maxX, maxY) = box
+            upperInside = (bbox[:, 2] <= maxX) & (bbox[:, 3] <= maxY) & (bbox[:, 2] >= minX) & (bbox[:, 3] >= minY)
+            lowerInside = (bbox[:, 0] >= minX) & (bbox[:, 1] >= minY) & (bbox[:, 0] <= maxX) & (bbox[:, 1] <= maxY)
+            keep = upperInside | lowerInside
+            if not keep.any():
                 return []
-            newBox = self.polygonsBoundingBox(circuitPolygons)
+            inside = bbox[keep]
+            newBox = (tuple(inside[:, :2].min(axis=0)), tuple(inside[:, 2:].max(axis=0)))
             if newBox == box:
                 break
             box = newBox
+        circuitPolygons = [poly for poly, isKept in zip(simplifiedPolys, keep.tolist()) if isKept]
         return circuitPolygons
 
     @classmethod
     def _deletePolygons(self, polygons):
-        indexes = set([poly[1] for poly in polygons])
-        self.allPolygons = [poly for index, poly in enumerate(self.allPolygons) if index not in indexes]
+        """
+        Marks polygons, given as ``(polygon, index)`` pairs, as removed.
+
+        ``self.allPolygons`` keeps its order so indices stay valid; removed
+        polygons are only cleared from ``self._alive``. The grid is rebuilt
+        over the remaining polygons once at least half of its entries are dead.
+        """
+        indexes = [poly[1] for poly in polygons]
+        if not indexes:
+            return
+        self._alive[indexes] = False
+        alive = np.flatnonzero(self._alive)
+        if len(alive) < self._gridSize / 2:
+            self._grid = _BoundingBoxGrid(self._bbox, indices=alive)
+            self._gridSize = len(alive)
+
+    @classmethod
+    def _buildSpatialIndex(self) -> None:
+        """
+        Caches the bounding boxes of ``self.allPolygons`` as an (N, 4) array
+        of ``[xmin, ymin, xmax, ymax]`` rows and builds a grid over them. All
+        polygons start out alive.
+        """
+        bboxes = [poly.bounding_box() for poly in self.allPolygons]
+        self._bounds = {id(poly): box for poly, box in zip(self.allPolygons, bboxes)}
+        self._polyIndex = {id(poly): i for i, poly in enumerate(self.allPolygons)}
+        self._bbox = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+        self._alive = np.ones(len(self.allPolygons), dtype=bool)
+        self._grid = _BoundingBoxGrid(self._bbox)
+        self._gridSize = len(self.allPolygons)
+        self._byPointCount = defaultdict(list)
+        for index, poly in enumerate(self.allPolygons):
+            self._byPointCount[len(poly.points)].append(index)
+
+    @classmethod
+    def _polyBounds(self, polygon):
+        """
+        ``polygon.bounding_box()``, answered from the boxes cached by
+        ``_buildSpatialIndex`` when the polygon is in ``self.allPolygons``.
+        """
+        box = self._bounds.get(id(polygon))
+        if box is None:
+            box = polygon.bounding_box()
+        return box
 
 
 
+    @classmethod
+    def _removeCoupler(self, grate) -> None:
+        """
+        Marks a grating coupler as used. ``self.gratingCouplers`` keeps its
+        order; only ``self._grateAlive`` changes.
+        """
+        self._grateAlive[self._grateIndex[id(grate)]] = False
+
     @classmethod
     def _getNextCircuit(self, vGroveSpacing, vGrovePorts) -> Union(List[Circuit], None):  
-        if len(self.gratingCouplers) == 0:
-            return None
-        startingCoupler = self.gratingCouplers[0]
-        circuitCouplers, maxUnits = self._sidewaySearch(startingCoupler, vGroveSpacing)
-        # circuitPolygons = self._getCircuitPolygons(circuitCouplers)
-        circuitPolygons = []
-        if maxUnits > vGrovePorts-1:
-            for poly in circuitCouplers: self.gratingCouplers.remove(poly)
-            return self._getNextCircuit(vGroveSpacing, vGrovePorts)
-        circuits = []
-        if len(circuitCouplers) > 1:
-            # Sort the couplers so the right most coupler is the first in the list
-            circuitCouplers = sorted(circuitCouplers, key=lambda poly: self.boundingBoxCenter(poly)[0], reverse=True)
-            if len(circuitCouplers) > 3:
-                circuitPolygons = self._getCircuitPolygons(circuitCouplers)
-                secondCircuitPolygons = self._getCircuitPolygons(circuitCouplers[1:-1])
-                separate = True
-                # set separate to false if secondCircuitPolygons has any polygon that are in circuit polygons
-                if len(circuitPolygons) == len(secondCircuitPolygons):
-                    separate = False
-                if separate:
-                    circuits.append(self._createNewCircuit(vGroveSpacing, vGrovePorts, circuitCouplers[1:-1], secondCircuitPolygons))
-                    for coupler in circuitCouplers[1:-1]:
-                        circuitCouplers.remove(coupler)
-                        self.gratingCouplers.remove(coupler)
-            circuits.append(self._createNewCircuit(vGroveSpacing, vGrovePorts, circuitCouplers, circuitPolygons))
-            for poly in circuitCouplers: 
-                self.gratingCouplers.remove(poly)
-            self._deletePolygons(circuitPolygons)
-            return circuits
-        else:
-            self.gratingCouplers.remove(startingCoupler)
+        while True:
+            # Couplers are only ever removed, so the first alive one never
+            # moves backwards.
+            while self._grateNext < len(self.gratingCouplers) and not self._grateAlive[self._grateNext]:
+                self._grateNext += 1
+            if self._grateNext == len(self.gratingCouplers):
+                return None
+            startingCoupler = self.gratingCouplers[self._grateNext]
+            circuitCouplers, maxUnits = self._sidewaySearch(startingCoupler, vGroveSpacing)
+            # circuitPolygons = self._getCircuitPolygons(circuitCouplers)
+            circuitPolygons = []
+            if maxUnits > vGrovePorts-1:
+                for poly in circuitCouplers: self._removeCoupler(poly)
+                continue
+            circuits = []
+            if len(circuitCouplers) > 1:
+                # Sort the couplers so the right most coupler is the first in the list
+                circuitCouplers = sorted(circuitCouplers, key=lambda poly: self._polyCenter(poly)[0], reverse=True)
+                if len(circuitCouplers) > 3:
+                    circuitPolygons = self._getCircuitPolygons(circuitCouplers)
+                    secondCircuitPolygons = self._getCircuitPolygons(circuitCouplers[1:-1])
+                    separate = True
+                    # set separate to false if secondCircuitPolygons has any polygon that are in circuit polygons
+                    if len(circuitPolygons) == len(secondCircuitPolygons):
+                        separate = False
+                    if separate:
+                        circuits.append(self._createNewCircuit(vGroveSpacing, vGrovePorts, circuitCouplers[1:-1], secondCircuitPolygons))
+                        for coupler in circuitCouplers[1:-1]:
+                            self._removeCoupler(coupler)
+                        circuitCouplers = [circuitCouplers[0], circuitCouplers[-1]]
+                circuits.append(self._createNewCircuit(vGroveSpacing, vGrovePorts, circuitCouplers, circuitPolygons))
+                for poly in circuitCouplers: 
+                    self._removeCoupler(poly)
+                self._deletePolygons(circuitPolygons)
+                return circuits
+            self._removeCoupler(startingCoupler)
             self._deletePolygons(circuitPolygons)
-            return self._getNextCircuit(vGroveSpacing, vGrovePorts)
     
     @classmethod
     def loadGDS(self, vGroveSpacing: int, vGrovePorts: int, filename: Union[str, Path]) -> None:
@@ -682,14 +817,18 @@ class CircuitMap:
         c = gf.Component()
         self.chip = c << gf.read.import_gds(filepath)
         
-        self.allPolygons = []
-        seen = set()
-        for poly in self.chip.parent.polygons:
-            center = (self.boundingBoxCenter(poly)[0], self.boundingBoxCenter(poly)[1])
-            if center in seen:
-                continue
-            seen.add(center)
-            self.allPolygons.append(poly)
+        # Drop polygons that share a bounding box center (to a thousandth of a
+        # unit) with an earlier one
+        polygons = list(self.chip.parent.polygons)
+        boxes = np.array([poly.bounding_box() for poly in polygons], dtype=np.float64).reshape(-1, 2, 2)
+        centers = (boxes[:, 0] + boxes[:, 1]) / 2
+        _, keep = np.unique(np.round(centers * 1000).astype(np.int64), axis=0, return_index=True)
+        self.allPolygons = [polygons[i] for i in np.sort(keep).tolist()]
+        self._buildSpatialIndex()
+        # Centers are cached once for the polygons of the chip and looked up
+        # by polygon identity.
+        self._center = (self._bbox[:, :2] + self._bbox[:, 2:]) / 2
+        self._centers = [tuple(center) for center in self._center.tolist()]
         # TODO maybe ??? look into shooting algo but it probably wont work
         # I think you'll have to either make a separate file or you need to go through circuits one by one
         # Or put this code into a generate file converter thing but even then files can vary a lot 
@@ -728,23 +867,23 @@ class CircuitMap:
         self.gratingCouplers.extend(self.polygonSearchGDS(self, 124))
         self.gratingCouplers.extend(self.polygonSearchGDS(self, 166))
         self.gratingCouplers.extend(self.polygonSearchGDS(self, 228))
+        grateIdx = np.array([self._polyIndex[id(poly)] for poly in self.gratingCouplers], dtype=np.intp)
         # Sort polygons from top to bottom left to right
-        self.gratingCouplers = sorted(self.gratingCouplers, key=lambda poly: (-self.boundingBoxCenter(poly)[1], self.boundingBoxCenter(poly)[0]))
-        
-        # Remove any overlapping polygons
-        removeIndexes = []
-        for index, poly in enumerate(self.gratingCouplers):
-            if index == len(self.gratingCouplers)-1:
-                break
-            nextPoly = self.gratingCouplers[index+1]
-            polyCenter = self.boundingBoxCenter(poly)
-            nextPolyCenter = self.boundingBoxCenter(nextPoly)
-            if (round(polyCenter[0]) == round(nextPolyCenter[0])
-                and round(polyCenter[1]) == round(nextPolyCenter[1])):
-                removeIndexes.append(self.gratingCouplers.index(nextPoly))
-        self.gratingCouplers = [self.gratingCouplers[i] for i in range(len(self.gratingCouplers)) if i not in removeIndexes]
+        grateIdx = grateIdx[np.lexsort((self._center[grateIdx, 0], -self._center[grateIdx, 1]))]
+        # Remove any overlapping polygons, keeping the first in sorted order
+        _, firstIdx = np.unique(np.round(self._center[grateIdx]), axis=0, return_index=True)
+        grateIdx = grateIdx[np.sort(firstIdx)]
+        self.gratingCouplers = [self.allPolygons[i] for i in grateIdx.tolist()]
+        self._grateIndex = {id(poly): i for i, poly in enumerate(self.gratingCouplers)}
+        self._grateAlive = np.ones(len(self.gratingCouplers), dtype=bool)
+        self._grateNext = 0
+        self._grateX = np.round(self._center[grateIdx, 0])
+        # Couplers bucketed by the y of their center, in sorted order
+        self._grateRows = defaultdict(list)
+        for i, poly in enumerate(self.gratingCouplers):
+            self._grateRows[self._polyCenter(poly)[1]].append(i)
         
-        print('Getting circuits')
+        log.info('Getting circuits')
         startTime = time.time()
         circuits = []
         while True:
@@ -753,7 +892,7 @@ class CircuitMap:
                 break
             circuits.extend(newCircuits)
         endTime = time.time()
-        print(f'Found {len(circuits)} circuits in {endTime - startTime} seconds')
+        log.info(f'Found {len(circuits)} circuits in {endTime - startTime} seconds')
         
 
         # Get calibration circuits
@@ -764,14 +903,14 @@ class CircuitMap:
             boundingBoxPoints[1],
             (boundingBoxPoints[1][0], boundingBoxPoints[0][1]),
             ]
-        # Find the polygons that are closest to the corners of the bounding box
-        for index, point in enumerate(boundingBoxPoints):
-            distances = [(circuit, np.linalg.norm(np.array(circuit.loc) - np.array(point))) for circuit in circuits]
-            closestCircuit = min(distances, key=lambda x: x[1])[0]
-            closestCircuit['calibration_circuit'] = 'True'
-            if index == 2:
-                break
-        return CircuitMap(circuits)
+        # Find the circuits that are closest to the first three corners of the bounding box
+        circuitMap = CircuitMap(circuits)
+        locs = circuitMap.locations
+        corners = np.array(boundingBoxPoints[:3], dtype=np.float64)
+        closest = np.linalg.norm(locs[:, None, :] - corners[None, :, :], axis=2).argmin(axis=0)
+        for index in closest.tolist():
+            circuits[index]['calibration_circuit'] = 'True'
+        return circuitMap
 
     @classmethod
     def loadtxt(self, filename: Union[str, Path]) -> CircuitMap:
@@ -805,27 +944,28 @@ class CircuitMap:
         if not filename.exists():
             raise FileNotFoundError(f"File '{filename}' does not exist")
         circuits = []
-        circuitLocs = {}
+        circuitLocs = set()
+        # Bind the per-line callables once; this loop runs for every circuit.
+        match = _LOC_RE.match
+        findall = _PARAM_RE.findall
+        intern = sys.intern
+        append = circuits.append
         with filename.open() as f:
             for i, line in enumerate(f):
                 line = line.strip()
-                if line.startswith("#"):
+                if not line or line[0] == "#":
                     continue
-                elif line == "":
-                    continue
-                elif line.startswith("("):
-                    locTxt, paramTxt = line[1:].split(")", 1)
-                    loc = [float(pt.strip()) for pt in locTxt.split(",")]
-                    loc = Location(*loc)
-                    params = {}
-                    paramTxt = paramTxt.split(",")
-                    for param in paramTxt:
-                        param = param.split("=")
-                        params[param[0].strip()] = param[1].strip()
-                    circuits.append(Circuit(loc, params))
-                    if loc in circuitLocs:
-                        raise CircuitMapUniqueKeyError(f"Duplicate location not allowed (lines {circuitLocs[loc]}, {i})")
-                    circuitLocs[loc] = i
-                else:
+                m = match(line)
+                if m is None:
                     log.warning("Could not parse line %s: '%s'", i+1, line)
+                    continue
+                x, y, paramTxt = m.groups()
+                loc = Location(float(x), float(y))
+                # Parameter names and values repeat across circuits; interning
+                # shares one string object per distinct name or value.
+                params = {intern(key): intern(val) for key, val in findall(paramTxt)}
+                append(Circuit(loc, params))
+                if loc in circuitLocs:
+                    raise CircuitMapUniqueKeyError(f"Duplicate location {loc} not allowed (line {i+1})")
+                circuitLocs.add(loc)
         return CircuitMap(circuits)
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Autogator Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see autogator/__init__.py for details)
+
+"""
+# Compiled
+
+Python modules generated from the .ui and .qrc files by ``tools/ui2py.py``.
+"""
@@ -12,24 +12,68 @@ is a keyboard controller, but you can also use a joystick or a mouse, or even
 an XBox controller. More controllers may be implemented here in the future.
 """
 
+import importlib
 import logging
 import threading
 import time
 import sys, os
-import keyboard
-from multiprocessing import Value
-import cv2
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
 
-from PySide6 import QtCore, QtGui, QtWidgets
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtGui import QKeySequence, QShortcut, QShortcutEvent, QKeyEvent, QPixmap
 from pydantic import BaseSettings
 
-from autogator.hardware import Stage
+from autogator.hardware import DLL_CALL_SPACING, Stage
 
 
 log = logging.getLogger(__name__)
 
+# keyboard and PySide6 are heavy to import and only needed once a controller
+# is running, so they are imported where they are used.
+
+
+def _load_ui(name: str, widgetClass: type):
+    """
+    Builds the window described by ``<name>.ui``.
+
+    Uses the class compiled into ``autogator.compiled`` by ``tools/ui2py.py``
+    when it is available, which avoids parsing the .ui XML at runtime.
+    Otherwise the .ui file is loaded with ``QUiLoader``. Either way, the
+    child widgets are available as attributes of the returned window.
+    """
+    moduleName = f"autogator.compiled.{name}_ui"
+    try:
+        module = importlib.import_module(moduleName)
+    except ModuleNotFoundError as exc:
+        # Only a missing compiled module means falling back; an import error
+        # from inside a compiled module is a real error
+        if exc.name not in (moduleName, "autogator.compiled"):
+            raise
+        from PySide6.QtUiTools import QUiLoader
+        loader = QUiLoader()
+        parentDir = os.path.join(os.path.dirname(__file__), os.pardir)
+        filePath = os.path.join(parentDir, f'{name}.ui')
+        return loader.load(filePath, None)
+    uiClass = next(getattr(module, attr) for attr in dir(module) if attr.startswith("Ui_"))
+    ui = uiClass()
+    window = widgetClass()
+    ui.setupUi(window)
+    for attr, widget in vars(ui).items():
+        setattr(window, attr, widget)
+    return window
+
+
+@lru_cache(maxsize=None)
+def _default_bindings(bindingsClass: type):
+    """
+    Reads the default bindings for ``bindingsClass`` from the environment
+    once per process.
+
+    Controllers take a copy so that changing one controller's bindings does
+    not affect the others.
+    """
+    return bindingsClass()
+
 
 class KeyloopKeyboardBindings(BaseSettings):
     """
@@ -68,301 +112,304 @@ class KeyboardControl:
     Debounces key presses to make sure that the stage does not get placed 
     into a deadlocked or unrecoverable state.
     """
+    # action: (motor lock, stage axis, direction)
+    _MOVES = {
+        "MOVE_LEFT": ("MOTOR_X", "x", "backward"),
+        "MOVE_RIGHT": ("MOTOR_X", "x", "forward"),
+        "MOVE_UP": ("MOTOR_Y", "y", "forward"),
+        "MOVE_DOWN": ("MOTOR_Y", "y", "backward"),
+        "MOVE_RAISE": ("MOTOR_Z", "z", "forward"),
+        "MOVE_LOWER": ("MOTOR_Z", "z", "backward"),
+    }
+    # action: (motor lock, stage axis, sign, step size attribute)
+    _JOGS = {
+        "JOG_LEFT": ("MOTOR_X", "x", -1, "linear_step_size"),
+        "JOG_RIGHT": ("MOTOR_X", "x", 1, "linear_step_size"),
+        "JOG_UP": ("MOTOR_Y", "y", 1, "linear_step_size"),
+        "JOG_DOWN": ("MOTOR_Y", "y", -1, "linear_step_size"),
+        "JOG_RAISE": ("MOTOR_Z", "z", 1, "vertical_step_size"),
+        "JOG_LOWER": ("MOTOR_Z", "z", -1, "vertical_step_size"),
+        "JOG_CLOCKWISE": ("MOTOR_PSI", "psi", 1, "rotational_step_size"),
+        "JOG_COUNTERCLOCKWISE": ("MOTOR_PSI", "psi", -1, "rotational_step_size"),
+    }
+
     def __init__(self, stage: Stage, bindings: KeyloopKeyboardBindings = None):
         self.stage = stage
 
         if bindings is None:
-            bindings = KeyloopKeyboardBindings()
+            bindings = _default_bindings(KeyloopKeyboardBindings).copy()
         self.bindings = bindings
 
         self.semaphores = {
-            "MOTOR_X" : threading.Semaphore(),
-            "MOTOR_Y" : threading.Semaphore(),
-            "MOTOR_Z" : threading.Semaphore(),
-            "MOTOR_PSI" : threading.Semaphore(),
+            "MOTOR_X" : threading.Lock(),
+            "MOTOR_Y" : threading.Lock(),
+            "MOTOR_Z" : threading.Lock(),
+            "MOTOR_PSI" : threading.Lock(),
         }
 
+        # Set by key release hooks while loop() is running
+        self._released = {action: threading.Event() for action in self._MOVES}
+        # Scan codes of the move keys, resolved by loop()
+        self._scanCodes = {}
+        # Seconds _move waits between checks of a held key, set by loop().
+        # Keys without a release hook are only noticed by polling.
+        self._holdTimeouts = {}
+        # Rendered again by loop() in case the bindings have changed
+        self._help_text = self._render_help(bindings.dict())
+
         self.linear_step_size = 0.1
         self.vertical_step_size = 0.1
         self.rotational_step_size = 0.1
 
-    def _move_left(self):
-        semaphore = self.semaphores["MOTOR_X"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.x.move_cont("backward")
-            while keyboard.is_pressed(self.bindings.MOVE_LEFT):
-                time.sleep(0.05)
-            self.stage.x.stop()
-            semaphore.release()
-
-    def _move_right(self):
-        semaphore = self.semaphores["MOTOR_X"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.x.move_cont("forward")
-            while keyboard.is_pressed(self.bindings.MOVE_RIGHT):
-                time.sleep(0.05)
-            self.stage.x.stop()
-            semaphore.release()
-
-    def _move_up(self):
-        semaphore = self.semaphores["MOTOR_Y"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_cont("forward")
-            while keyboard.is_pressed(self.bindings.MOVE_UP):
-                time.sleep(0.05)
-            self.stage.y.stop()
-            semaphore.release()
-
-    def _move_down(self):
-        semaphore = self.semaphores["MOTOR_Y"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_cont("backward")
-            while keyboard.is_pressed(self.bindings.MOVE_DOWN):
-                time.sleep(0.05)
-            self.stage.y.stop()
-            semaphore.release()
-
-    def _move_raise(self):
-        semaphore = self.semaphores["MOTOR_Z"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.z.move_cont("forward")
-            while keyboard.is_pressed(self.bindings.MOVE_RAISE):
-                time.sleep(0.05)
-            self.stage.z.stop()
-            semaphore.release()
-
-    def _move_lower(self):
-        semaphore = self.semaphores["MOTOR_Z"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.z.move_cont("backward")
-            while keyboard.is_pressed(self.bindings.MOVE_LOWER):
-                time.sleep(0.05)
-            self.stage.z.stop()
-            semaphore.release()
-
-    def _jog_left(self):
-        semaphore = self.semaphores["MOTOR_X"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.x.move_by(-self.linear_step_size)
-            semaphore.release()
-
-    def _jog_right(self):
-        semaphore = self.semaphores["MOTOR_X"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.x.move_by(self.linear_step_size)
-            semaphore.release()
-
-    def _jog_up(self):
-        semaphore = self.semaphores["MOTOR_Y"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_by(self.linear_step_size)
-            semaphore.release()
-
-    def _jog_down(self):
-        semaphore = self.semaphores["MOTOR_Y"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_by(-self.linear_step_size)
-            semaphore.release()
-
-    def _jog_raise(self):
-        semaphore = self.semaphores["MOTOR_Z"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_by(self.linear_step_size)
-            semaphore.release()
-
-    def _jog_lower(self):
-        semaphore = self.semaphores["MOTOR_Z"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.y.move_by(-self.linear_step_size)
-            semaphore.release()
+    def _move(self, action):
+        """
+        Moves a motor continuously for as long as the key bound to
+        ``action`` is held down.
+        """
+        import keyboard
 
-    def _jog_cw(self):
-        semaphore = self.semaphores["MOTOR_PSI"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.psi.move_by(self.rotational_step_size)
+        motor, axis, direction = self._MOVES[action]
+        semaphore = self.semaphores[motor]
+        # A busy motor ignores the key press instead of waiting for the lock
+        if not semaphore.acquire(blocking=False):
+            return
+        try:
+            axis = getattr(self.stage, axis)
+            keys = self._scanCodes.get(action) or (getattr(self.bindings, action),)
+            timeout = self._holdTimeouts.get(action, 0.05)
+            released = self._released[action]
+            released.clear()
+            axis.move_cont(direction)
+            # Woken by the release hook if there is one; otherwise the
+            # timeout is what notices the release.
+            while any(keyboard.is_pressed(key) for key in keys):
+                released.wait(timeout)
+                released.clear()
+            axis.stop()
+        finally:
             semaphore.release()
 
-    def _jog_ccw(self):
-        semaphore = self.semaphores["MOTOR_PSI"]
-        if semaphore.acquire(timeout=0.1):
-            self.stage.psi.move_by(-self.rotational_step_size)
+    def _jog(self, action):
+        """
+        Moves a motor by one step of the size set for it.
+        """
+        motor, axis, sign, step = self._JOGS[action]
+        semaphore = self.semaphores[motor]
+        if not semaphore.acquire(blocking=False):
+            return
+        try:
+            getattr(self.stage, axis).move_by(sign * getattr(self, step))
+        finally:
             semaphore.release()
 
-    def _set_linear_jog_step(self):
-        val = None
-        while val is None:
-            answer = input(f"Enter new step size or [ENTER] to cancel (current {self.linear_step_size}): ")
-            if answer == "n":
-                return
-            try:
-                val = float(answer)
-            except ValueError:
-                pass
-        self.linear_step_size = val
-        print(f"New step size set: {self.linear_step_size}")
-
-    def _set_vertical_jog_step(self):
-        val = None
-        while val is None:
-            answer = input(f"Enter new step size or [ENTER] to cancel (current {self.vertical_step_size}): ")
-            if answer == "n":
-                return
-            try:
-                val = float(answer)
-            except ValueError:
-                pass
-        self.vertical_step_size = val
-        print(f"New step size set: {self.vertical_step_size}")
-
-    def _set_rotational_jog_step(self):
+    def _set_jog_step(self, step):
+        """
+        Prompts for a new value of the step size attribute ``step``.
+        """
+        current = getattr(self, step)
         val = None
         while val is None:
-            answer = input(f"Enter new step size or [ENTER] to cancel (current {self.rotational_step_size}): ")
-            if answer == "n":
+            answer = input(f"Enter new step size or [ENTER] to cancel (current {current}): ").strip()
+            if answer in ("", "n"):
                 return
             try:
                 val = float(answer)
             except ValueError:
                 pass
-        self.rotational_step_size = val
-        print(f"New step size set: {self.rotational_step_size}")
+        setattr(self, step, val)
+        print(f"New step size set: {getattr(self, step)}")
 
     def _home(self):
         confirm = input("Are you sure you want to home? Type 'yes' to confirm: ")
         if confirm != "yes":
             return
-        for semaphore in self.semaphores.values():
-            semaphore.acquire()
-        for motor in self.stage.motors:
-            if motor:
-                motor.home()
-        for semaphore in self.semaphores.values():
-            semaphore.release()
+        motors = [motor for motor in self.stage.motors if motor]
+        # Hold every motor lock so no key press can move the stage while the
+        # motors home concurrently
+        with ExitStack() as stack:
+            for semaphore in self.semaphores.values():
+                stack.enter_context(semaphore)
+            with ThreadPoolExecutor(max_workers=max(len(motors), 1)) as executor:
+                futures = []
+                for motor in motors:
+                    futures.append(executor.submit(motor.home))
+                    time.sleep(DLL_CALL_SPACING)
+                for future in futures:
+                    future.result()
         log.info("Homing complete")
     
 
+    def _stop_all(self):
+        """
+        Stops every motor immediately, without waiting for the motor locks.
+
+        Any continuous move still running sees its motor stop; its key release
+        then stops the motor again, which is harmless.
+        """
+        try:
+            self.stage.stop_all()
+        except Exception:
+            log.exception("Error while stopping all motors")
+
+    @staticmethod
+    def _render_help(bindings: dict) -> str:
+        """
+        Lists each action with its key, in the order the bindings define them.
+        """
+        lines = "".join(f"        {action.lower().replace('_', ' ')}: {key}\n" for action, key in bindings.items())
+        return f"\n        Stage Control\n        -------------\n{lines}        "
+
     def _help(self):
-        print(f"""
-        Stage Control
-        -------------
-        move left: {self.bindings.MOVE_LEFT}
-        move right: {self.bindings.MOVE_RIGHT}
-        move up: {self.bindings.MOVE_UP}
-        move down: {self.bindings.MOVE_DOWN}
-        move raise: {self.bindings.MOVE_RAISE}
-        move lower: {self.bindings.MOVE_LOWER}
-        jog left: {self.bindings.JOG_LEFT}
-        jog right: {self.bindings.JOG_RIGHT}
-        jog up: {self.bindings.JOG_UP}
-        jog down: {self.bindings.JOG_DOWN}
-        jog raise: {self.bindings.JOG_RAISE}
-        jog lower: {self.bindings.JOG_LOWER}
-        jog clockwise: {self.bindings.JOG_CLOCKWISE}
-        jog counterclockwise: {self.bindings.JOG_COUNTERCLOCKWISE}
-        linear jog step: {self.bindings.LINEAR_JOG_STEP}
-        vertical jog step: {self.bindings.VERTICAL_JOG_STEP}
-        rotational jog step: {self.bindings.ROTATIONAL_JOG_STEP}
-        home: {self.bindings.HOME}
-        help: {self.bindings.HELP}
-        quit: {self.bindings.QUIT}
-        """)
-        # stop all: {self.bindings.STOP_ALL}
+        print(self._help_text)
 
     def loop(self) -> None:
         """
         Enters a blocking loop to control stage motion.
+
+        Each hotkey hands its action straight to a small thread pool. Presses
+        of an action that is still running (e.g. key repeats while a move
+        key is held) are ignored.
         """
-        running = threading.Event()
-        running.set()
-
-        actions = list(self.bindings.dict().keys())
-        keys = list(self.bindings.dict().values())
-        funcs = {
-            "MOVE_LEFT": self._move_left,
-            "MOVE_RIGHT": self._move_right,
-            "MOVE_UP": self._move_up,
-            "MOVE_DOWN": self._move_down,
-            "MOVE_RAISE": self._move_raise,
-            "MOVE_LOWER": self._move_lower,
-            "JOG_LEFT": self._jog_left,
-            "JOG_RIGHT": self._jog_right,
-            "JOG_UP": self._jog_up,
-            "JOG_DOWN": self._jog_down,
-            "JOG_RAISE": self._jog_raise,
-            "JOG_LOWER": self._jog_lower,
-            "JOG_CLOCKWISE": self._jog_cw,
-            "JOG_COUNTERCLOCKWISE": self._jog_ccw,
-            "LINEAR_JOG_STEP": self._set_linear_jog_step,
-            "VERTICAL_JOG_STEP": self._set_vertical_jog_step,
-            "ROTATIONAL_JOG_STEP": self._set_rotational_jog_step,
+        import keyboard
+
+        stop = threading.Event()
+        funcs = {action: partial(self._move, action) for action in self._MOVES}
+        funcs.update({action: partial(self._jog, action) for action in self._JOGS})
+        funcs.update({
+            "LINEAR_JOG_STEP": partial(self._set_jog_step, "linear_step_size"),
+            "VERTICAL_JOG_STEP": partial(self._set_jog_step, "vertical_step_size"),
+            "ROTATIONAL_JOG_STEP": partial(self._set_jog_step, "rotational_step_size"),
             "HOME": self._home,
             "HELP": self._help,
-        }
-        flags = {binding : threading.Event() for binding in actions}
-
-        # keyboard.add_hotkey(self.bindings.MOVE_LEFT, lambda: self._move_left(semaphores[self.bindings.MOVE_LEFT]))
-        keyboard.add_hotkey(self.bindings.MOVE_LEFT, lambda: flags["MOVE_LEFT"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_RIGHT, lambda: flags["MOVE_RIGHT"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_UP, lambda: flags["MOVE_UP"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_DOWN, lambda: flags["MOVE_DOWN"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_RAISE, lambda: flags["MOVE_RAISE"].set())
-        keyboard.add_hotkey(self.bindings.MOVE_LOWER, lambda: flags["MOVE_LOWER"].set())
-        keyboard.add_hotkey(self.bindings.JOG_LEFT, lambda: flags["JOG_LEFT"].set())
-        keyboard.add_hotkey(self.bindings.JOG_RIGHT, lambda: flags["JOG_RIGHT"].set())
-        keyboard.add_hotkey(self.bindings.JOG_UP, lambda: flags["JOG_UP"].set())
-        keyboard.add_hotkey(self.bindings.JOG_DOWN, lambda: flags["JOG_DOWN"].set())
-        keyboard.add_hotkey(self.bindings.JOG_RAISE, lambda: flags["JOG_RAISE"].set())
-        keyboard.add_hotkey(self.bindings.JOG_LOWER, lambda: flags["JOG_LOWER"].set())
-        keyboard.add_hotkey(self.bindings.JOG_CLOCKWISE, lambda: flags["JOG_CLOCKWISE"].set())
-        keyboard.add_hotkey(self.bindings.JOG_COUNTERCLOCKWISE, lambda: flags["JOG_COUNTERCLOCKWISE"].set())
-        keyboard.add_hotkey(self.bindings.LINEAR_JOG_STEP, lambda: flags["LINEAR_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.VERTICAL_JOG_STEP, lambda: flags["VERTICAL_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.ROTATIONAL_JOG_STEP, lambda: flags["ROTATIONAL_JOG_STEP"].set())
-        keyboard.add_hotkey(self.bindings.HOME, lambda: flags["HOME"].set())
-        keyboard.add_hotkey(self.bindings.HELP, lambda: flags["HELP"].set())
-        keyboard.add_hotkey(self.bindings.QUIT, lambda: running.clear())
-        keyboard.add_hotkey(self.bindings.HELP, lambda: flags["HELP"].set())
-
-        def run_flagged():
-            for action, flag in flags.items():
-                if flag.is_set():
-                    t = threading.Thread(target=funcs[action], daemon=True)
-                    t.start()
-                    flag.clear()
-
-        log.info("Entering keyboard control loop")
-        while running.is_set():
-            run_flagged()
-            time.sleep(0.1)
-        
+        })
+        pending = set()
+        # Futures of pending actions, so STOP_ALL can cancel queued ones
+        queued = {}
+        lock = threading.Lock()
+        # One worker per motor semaphore
+        pool = ThreadPoolExecutor(max_workers=len(self.semaphores), thread_name_prefix="keyboard-control")
+
+        def run(action, func):
+            try:
+                func()
+            except Exception:
+                log.exception(f"Error while running {action}")
+            finally:
+                with lock:
+                    pending.discard(action)
+                    queued.pop(action, None)
+
+        def dispatch(action, func):
+            with lock:
+                if action in pending:
+                    return
+                pending.add(action)
+                queued[action] = pool.submit(run, action, func)
+
+        # The motors are stopped on their own thread; the stop calls are made
+        # one motor at a time and would otherwise hold up every key event,
+        # including the release hooks.
+        stopRequested = threading.Event()
+
+        def stopper():
+            while True:
+                stopRequested.wait()
+                stopRequested.clear()
+                if stop.is_set():
+                    return
+                self._stop_all()
+
+        def stop_all():
+            # Actions still waiting in the pool must not move the stage again
+            # once it has been stopped
+            with lock:
+                for action, future in list(queued.items()):
+                    if future.cancel():
+                        pending.discard(action)
+                        del queued[action]
+            stopRequested.set()
+
+        stopThread = threading.Thread(target=stopper, name="keyboard-control-stop", daemon=True)
+        stopThread.start()
+
+        # Read the bindings once for all registrations below; each hotkey
+        # carries its own function so dispatch needs no lookup
+        bindings = self.bindings.dict()
+        self._help_text = self._render_help(bindings)
+        hotkeys = []
+        hooks = []
+        try:
+            for action, func in funcs.items():
+                hotkeys.append(keyboard.add_hotkey(bindings[action], dispatch, args=(action, func)))
+            hotkeys.append(keyboard.add_hotkey(bindings["QUIT"], stop.set))
+            # Bypasses the pool so it never waits behind a queued action
+            hotkeys.append(keyboard.add_hotkey(bindings["STOP_ALL"], stop_all))
+            # Resolve the move keys once so _move does not parse the key name
+            # every time it checks whether the key is still held
+            for action, released in self._released.items():
+                try:
+                    codes = keyboard.key_to_scan_codes(bindings[action])
+                except ValueError:
+                    # Not a single key, so there is no release hook to add;
+                    # _move polls is_pressed, which parses the combination
+                    self._scanCodes[action] = (bindings[action],)
+                    self._holdTimeouts[action] = 0.05
+                    continue
+                self._scanCodes[action] = codes
+                # The hook ends the wait; the timeout only guards against a
+                # missed release event
+                self._holdTimeouts[action] = 0.5
+                hooks.append(keyboard.on_release_key(bindings[action], lambda event, released=released: released.set()))
+
+            log.info("Entering keyboard control loop")
+            stop.wait()
+        finally:
+            for hotkey in hotkeys:
+                keyboard.remove_hotkey(hotkey)
+            for hook in hooks:
+                keyboard.unhook(hook)
+            stop.set()
+            stopRequested.set()
+            pool.shutdown(wait=False)
 
         # else:
         # clean up all current running actions, make sure all semaphores are freed
     
-class KeyReleaseEventFilter(QtCore.QObject):
-    '''
-    This is used to detect when a key shortcut was released. 
-    '''
-    def __init__(self, obj, callback):
-        super().__init__(obj)
-        self.callback = callback
-        self.released = False
-
-    def eventFilter(self, obj, event):
-        if event.type() == QtCore.QEvent.KeyRelease and not event.isAutoRepeat():
-            self.callback()
-        return super().eventFilter(obj, event)
-
-class CloseEventFilter(QtCore.QObject):
-    def __init__(self, window, callback):
-        super().__init__(window)
-        self.callback = callback
-
-    def eventFilter(self, obj, event):
-        if event.type() == QtCore.QEvent.Close:
-            self.callback()
-        return super().eventFilter(obj, event)
-        
+@lru_cache(maxsize=None)
+def _event_filters():
+    """
+    Defines the Qt event filter classes the first time they are needed, so
+    importing this module does not import Qt.
+    """
+    from PySide6 import QtCore
+
+    class KeyReleaseEventFilter(QtCore.QObject):
+        '''
+        This is used to detect when a key shortcut was released. 
+        '''
+        def __init__(self, obj, callback):
+            super().__init__(obj)
+            self.callback = callback
+            self.released = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.KeyRelease and not event.isAutoRepeat():
+                self.callback()
+            return super().eventFilter(obj, event)
+
+    class CloseEventFilter(QtCore.QObject):
+        def __init__(self, window, callback):
+            super().__init__(window)
+            self.callback = callback
+
+        def eventFilter(self, obj, event):
+            if event.type() == QtCore.QEvent.Close:
+                self.callback()
+            return super().eventFilter(obj, event)
+
+    return {"KeyReleaseEventFilter": KeyReleaseEventFilter, "CloseEventFilter": CloseEventFilter}
+
+
 class KeyboardGUIBindings(BaseSettings):
     '''
     Sets default keyboard bindings for KeyboardControlGUI controller.
@@ -390,37 +437,40 @@ class KeyboardControlGUI:
 
     def __init__(self, stage: Stage, bindings: KeyboardGUIBindings = None):
         if bindings is None:
-            bindings = KeyboardGUIBindings()
+            bindings = _default_bindings(KeyboardGUIBindings).copy()
         self.bindings = bindings
         self.stage = stage
-        self.buttonPressed = Value('b', False)
+        self.buttonPressed = threading.Event()
         self.stopEvent = threading.Event()
 
         self.axes = {
-            'X': threading.Semaphore(), 
-            'Y': threading.Semaphore(),
-            'Z': threading.Semaphore(), 
-            'PSI': threading.Semaphore()
+            'X': threading.Lock(),
+            'Y': threading.Lock(),
+            'Z': threading.Lock(),
+            'PSI': threading.Lock()
         }
+        # Button presses run on these workers instead of a new thread each
+        self._pool = ThreadPoolExecutor(max_workers=len(self.axes), thread_name_prefix="keyboard-gui")
+        from PySide6 import QtWidgets
+        filters = _event_filters()
+
         if QtWidgets.QApplication.instance() is not None:
             self.app = QtWidgets.QApplication.instance()
         else:
             self.app = QtWidgets.QApplication(sys.argv)
         self._loadWindow()
 
-        eventFilter = KeyReleaseEventFilter(self.w, self._setButtonPressedFalse)
+        eventFilter = filters["KeyReleaseEventFilter"](self.w, self._setButtonPressedFalse)
         self.w.installEventFilter(eventFilter)
-        closeEventFilter = CloseEventFilter(self.w, self.close)
+        closeEventFilter = filters["CloseEventFilter"](self.w, self.close)
         self.w.installEventFilter(closeEventFilter)
 
         self.bindingPairs = self._mapBindings(bindings)
         self.mainWindowSetup()
     
     def _loadWindow(self):
-        loader = QUiLoader()
-        parentDir = os.path.join(os.path.dirname(__file__), os.pardir)
-        filePath = os.path.join(parentDir, 'keyboardGUI.ui')
-        self.w = loader.load(filePath, None)
+        from PySide6 import QtWidgets
+        self.w = _load_ui('keyboardGUI', QtWidgets.QWidget)
         
     def loop(self):
         self.w.show()
@@ -428,82 +478,81 @@ class KeyboardControlGUI:
 
     def close(self):
         self.stopEvent.set()
+        self.buttonPressed.clear()
+        self._pool.shutdown(wait=False)
         self.w.close()
         self.app.quit()
     
     def _mapBindings(self, bindings):
-        bindingNames = [attr for attr in dir(bindings) if not attr.startswith('_') and attr.isupper() and '_' in attr]
+        bindingNames = {attr for attr in dir(bindings) if not attr.startswith('_') and attr.isupper() and '_' in attr}
         buttons = self.w.motionControls.buttons()
-        bindingTups = []
-        for button in buttons:
-            for binding in bindingNames:
-                if button.objectName() == binding:
-                    bindingTups.append((button, binding))
-                    break
+        bindingTups = [(button, button.objectName()) for button in buttons if button.objectName() in bindingNames]
 
         if len(bindingTups) != len(self.axes.keys())*2:
             raise RuntimeError('Number of bindings doesn\'t match the number of motion buttons.')
         return bindingTups
 
     def _moveEventThreader(self, button):
-        if not self.buttonPressed.value:
-            self.buttonPressed.value = True
-            t = threading.Thread(target=self._moveEvent, daemon=True, args=[button, self.buttonPressed])
-            t.start()
+        if not self.buttonPressed.is_set():
+            self.buttonPressed.set()
+            self._pool.submit(self._moveEvent, button, self.buttonPressed)
 
     def _moveEvent(self, button, buttonPressed):
-        buttonName = button.objectName()
-        # Get the axis of direction
-        axis = None
-        for axis in self.axes.keys(): 
-            if axis in buttonName:
-                break
-
-        # Get the direction of the button
-        direction = 'forward'
-        if 'MINUS' in buttonName:
-            direction = 'backward'
-
-        # See if we need to move continuous or not
-        semaphore = self.axes[axis]
-        axisPos = eval(f'self.w.{axis}_POS')
-        axis = eval(f'self.stage.{axis.lower()}')
-        if semaphore.acquire(timeout=0.1):
+        axis, semaphore, direction, axisPos = self._moveTable[button.objectName()]
+
+        # A busy motor ignores the press instead of stalling a thread on it
+        if not semaphore.acquire(blocking=False):
+            return
+        try:
+            # See if we need to move continuous or not
             if self.w.stepRadio.isChecked():
                 motionValue = self.w.stepSpinBox.value()
                 if direction == 'backward':
                     motionValue = motionValue * -1
                 axis.move_by(motionValue)
                 pos = axis.get_position()
-                semaphore.release()
-                # Update the position on the gui
-                axisPos.display(pos)
             else:
                 motionValue = self.w.velocitySpinBox.value()
-                while buttonPressed.value:
+                while buttonPressed.is_set():
                     axis.move_cont(direction)
                     pos = axis.get_position()
                     axisPos.display(pos)
                     time.sleep(0.2)
                 axis.stop()
                 pos = axis.get_position()
-                axisPos.display(pos)
-                semaphore.release()
+        finally:
+            semaphore.release()
+        # Update the position on the gui
+        axisPos.display(pos)
 
     def mainWindowSetup(self):
         self.w.setWindowTitle('Keyboard Control')
         self.w.continuousRadio.setChecked(True)
 
+        # Map each motion button to its motor, semaphore, direction and
+        # position display once, so button presses don't have to work it out
+        self._moveTable = {}
+        for button, bindingName in self.bindingPairs:
+            axis = next(axis for axis in self.axes if axis in bindingName)
+            direction = 'backward' if 'MINUS' in bindingName else 'forward'
+            self._moveTable[button.objectName()] = (
+                getattr(self.stage, axis.lower()),
+                self.axes[axis],
+                direction,
+                getattr(self.w, f'{axis}_POS'),
+            )
+
         # Setup motion controls
         for button, bindingName in self.bindingPairs:
             binding = getattr(self.bindings, bindingName)
             self._setupButton(binding, button, self._moveEventThreader)
 
         for axis in self.axes.keys():
-            pos = eval(f'self.stage.{axis.lower()}').get_position()
-            eval(f'self.w.{axis}_POS.display({pos})')
+            pos = getattr(self.stage, axis.lower()).get_position()
+            getattr(self.w, f'{axis}_POS').display(pos)
 
     def _setupButton(self, key, button, function):
+        from PySide6.QtGui import QKeySequence, QShortcut
         shortcut = QShortcut(QKeySequence(key), self.w)
         shortcut.setAutoRepeat(False)
         shortcut.activated.connect(button.pressed)
@@ -511,7 +560,7 @@ class KeyboardControlGUI:
         button.released.connect(self._setButtonPressedFalse)
 
     def _setButtonPressedFalse(self):
-        self.buttonPressed.value = False
+        self.buttonPressed.clear()
 
 class FullControl(KeyboardControlGUI):
     '''
@@ -527,10 +576,8 @@ class FullControl(KeyboardControlGUI):
         
 
     def _loadWindow(self):
-        loader = QUiLoader()
-        parentDir = os.path.join(os.path.dirname(__file__), os.pardir)
-        filePath = os.path.join(parentDir, 'fullControl.ui')
-        self.w = loader.load(filePath, None)
+        from PySide6 import QtWidgets
+        self.w = _load_ui('fullControl', QtWidgets.QMainWindow)
     
     def setupCamera(self) -> None:
         if not 'camera' in self.stage.auxiliaries.keys():
@@ -538,11 +585,14 @@ class FullControl(KeyboardControlGUI):
         self.cam = self.stage.auxiliaries['camera']
     
     def startScopeLoop(self):
+        from PySide6 import QtWidgets
         label = self.w.findChild(QtWidgets.QLabel, "scopeView")
         t = threading.Thread(target=self._showScopeFeed, daemon=True, args=[label, self.stage.scope])
         t.start()
     
     def _showScopeFeed(self, label, scope):
+        from PySide6 import QtCore
+        from PySide6.QtGui import QPixmap
         while True:
             framePath = os.getcwd() + '/temp.png'
             scope.driver.screenshot(framePath)
@@ -556,6 +606,7 @@ class FullControl(KeyboardControlGUI):
         t.start()
     
     def _showCamVideo(self, cam):
+        from PySide6 import QtGui, QtWidgets
         graphics_view = self.w.findChild(QtWidgets.QGraphicsView, "cameraView")
 
         # Create a scene and add an image to it
@@ -589,6 +640,15 @@ class FullControl(KeyboardControlGUI):
             cam.close()
 
 
+def __getattr__(name):
+    """
+    Serves the Qt event filter classes, which used to be defined at module
+    level, without importing Qt when the module is imported.
+    """
+    if name in ("KeyReleaseEventFilter", "CloseEventFilter"):
+        return _event_filters()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
     from autogator.api import load_default_configuration
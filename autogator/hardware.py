@@ -21,6 +21,7 @@ This module serves the following purposes:
 
 import concurrent.futures
 import importlib
+import io
 import logging
 from pathlib import Path
 import time
@@ -37,10 +38,15 @@ except:
 
 from autogator.errors import UncalibratedStageError
 from autogator.circuits import CircuitMap
+from autogator.utils import write_atomic
 
 
 log = logging.getLogger(__name__)
 
+# Seconds to wait between starting concurrent motor calls, which may go
+# through the same vendor DLL
+DLL_CALL_SPACING = 0.01
+
 
 class HardwareDevice:
     """
@@ -565,7 +571,9 @@ class Stage:
         filename : str
             The path to the file to save the conversion matrix to.
         """
-        np.savetxt(filename, self.calibration_matrix)
+        content = io.StringIO()
+        np.savetxt(content, self.calibration_matrix)
+        write_atomic(Path(filename), content.getvalue())
 
     @property
     def motors(self) -> list:
@@ -609,7 +617,7 @@ class Stage:
             future_to_cmd = {}
             for motor, pos in commands:
                 future_to_cmd[executor.submit(motor.move_to, pos)] = motor
-                time.sleep(0.01) # Space out simultaneous calls to potentially shared DLLs
+                time.sleep(DLL_CALL_SPACING)
             for future in concurrent.futures.as_completed(future_to_cmd):
                 motor = future_to_cmd[future]
                 try:
@@ -841,15 +849,14 @@ class StageConfiguration(BaseSettings):
                     status = "success"
                     break
                 except Exception as e:
-                    #log.info("Failed to connect to", name, "trying again")
                     count += 1
-                    print(count)
+                    log.debug(f"Failed to connect to {name} (attempt {count}), trying again")
 
             # Space out simultaneous calls to potentially shared DLLs
             if (status == "success"):
                 loaded[name] = driver
             else:
-                print(f"failed to connect after {max_retries} attempts")
+                log.error(f"Failed to connect to {name} after {max_retries} attempts")
         ###################################
 
 
@@ -14,6 +14,9 @@ hardware configurations or setups.
 Also provides a way to associate calibration matrices with configurations.
 """
 
+import io
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -22,6 +25,12 @@ from pydantic import BaseModel
 
 from autogator import AUTOGATOR_DATA_DIR
 from autogator.hardware import StageConfiguration
+from autogator.utils import write_atomic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 PROFILES_DIR = AUTOGATOR_DATA_DIR / "profiles"
@@ -32,6 +41,15 @@ CALIBRATION_DIR.mkdir(parents=True, exist_ok=True)
 _REGISTRY_FILE = PROFILES_DIR / "_registry.json"
 
 
+def _read_json(path: Path):
+    """
+    Reads a JSON file with ``orjson`` if it is installed, otherwise the
+    standard library.
+    """
+    content = Path(path).read_bytes()
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
 class _ConfigurationRegistry(BaseModel):
     """
     A registry of configurations. AutoGator internal object.
@@ -46,12 +64,11 @@ class _ConfigurationRegistry(BaseModel):
 
         Always saves to the same registry file in the profiles directory.
         """
-        with _REGISTRY_FILE.open("w") as f:
-            f.write(self.json())
+        write_atomic(_REGISTRY_FILE, self.json())
 
 
 try:
-    _cfg_registry = _ConfigurationRegistry.parse_file(_REGISTRY_FILE)
+    _cfg_registry = _ConfigurationRegistry.parse_obj(_read_json(_REGISTRY_FILE))
 except FileNotFoundError:
     _cfg_registry = _ConfigurationRegistry()
     _cfg_registry.save()
@@ -97,7 +114,9 @@ def update_calibration_matrix(name: str, matrix: np.ndarray) -> None:
     if name not in known_configurations():
         raise ValueError(f"Cannot associate matrix with configuration '{name}', which does not exist.")
     matrix_path = CALIBRATION_DIR / f"{name}.txt"
-    np.savetxt(str(matrix_path), matrix)
+    content = io.StringIO()
+    np.savetxt(content, matrix)
+    write_atomic(matrix_path, content.getvalue())
 
     cfg = load_configuration(name)
     cfg.calibration_matrix = matrix_path
@@ -128,7 +147,7 @@ def save_configuration(name: str, configuration: StageConfiguration) -> None:
     profile_path = PROFILES_DIR / f"{name}.json"
     if profile_path.is_file():
         raise ValueError(f"Profile '{name}' already exists.")
-    configuration.save(profile_path)
+    write_atomic(profile_path, configuration.json())
 
 
 def update_configuration(name: str, config: StageConfiguration) -> None:
@@ -152,14 +171,25 @@ def update_configuration(name: str, config: StageConfiguration) -> None:
     if name.startswith("_"):
         raise ValueError("Names cannot begin with an underscore.")
     profile_path = PROFILES_DIR / f"{name}.json"
-    with profile_path.open("w") as f:
-        f.write(config.json())
+    write_atomic(profile_path, config.json())
+
+
+@lru_cache(maxsize=8)
+def _parse_configuration(path: str, mtime_ns: int, size: int) -> StageConfiguration:
+    """
+    Parses a profile file. Cached on the file's modification time and size,
+    so an edited profile is parsed again on its next load.
+    """
+    return StageConfiguration.parse_obj(_read_json(path))
 
 
 def load_configuration(name: str) -> StageConfiguration:
     """
     Loads a configuration from a file.
 
+    Unchanged profiles are parsed only once; each call returns a fresh copy
+    that can be modified freely.
+
     Parameters
     ----------
     name : str
@@ -172,7 +202,9 @@ def load_configuration(name: str) -> StageConfiguration:
     """
     profile_path = PROFILES_DIR / f"{name}.json"
     if profile_path.is_file():
-        return StageConfiguration.parse_file(profile_path)
+        stat = profile_path.stat()
+        cfg = _parse_configuration(str(profile_path), stat.st_mtime_ns, stat.st_size)
+        return cfg.copy(deep=True)
     else:
         raise ValueError(f"Profile '{name}' does not exist.")
 
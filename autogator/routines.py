@@ -88,7 +88,7 @@ def setupScopeWithCircuit(
     DURATION = 1e-8
     scope = scope.driver
     # Set the scope to look at the first output channel
-    for index, port in enumerate(circuit.ports):
+    for index, port in enumerate(circuit["ports"]):
         if isinstance(port, Output):
             break
     channel = index + 1
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Autogator Project Contributors
+# Licensed under the terms of the GNU GPLv3+ License
+# (see autogator/__init__.py for details)
+
+"""
+# Utilities
+
+Small helpers shared by the other AutoGator modules.
+"""
+
+import os
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """
+    Writes a file by writing a temporary file next to it and renaming it into
+    place, so a crash never leaves a partially written file behind.
+
+    Parameters
+    ----------
+    path : Path
+        The file to write.
+    content : str
+        The full text of the file.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with tmp.open("w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
@@ -4,8 +4,6 @@
 # Licensed under the terms of the GNU GPLv3+ License
 # (see autogator/__init__.py for details)
 
-import configparser
-
 import autogator.config as cfg
 import autogator.expirement.platformcalibrator as cal
 
@@ -15,7 +13,7 @@ import autogator.dataCache as data
 def shutdown():
     dataCache = data.DataCache.get_instance()
     response = input("Would you like to save your configurations? (y/n)")
-    if response.lower().count("y") > 0:
+    if response.strip()[:1] in ("y", "Y"):
         print("Saving...")
         dataCache.set_configuration()
         print("Saved")
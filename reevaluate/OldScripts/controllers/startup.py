@@ -10,7 +10,7 @@ import autogator.dataCache as glob
 def startup():
     data_cache = glob.DataCache.get_instance()
     response = input("Would you like to Calibrate your Configuration? (y/n)")
-    if response.lower().count("y") > 0:
+    if response.strip()[:1] in ("y", "Y"):
         print("Calibrating...")
         data_cache.calibrate()
         data_cache.set_configuration()
@@ -1,5 +1,22 @@
+import logging
+import pickle
+
+import numpy as np
 import pytest
 
+pytest.importorskip("gdstk")
+
+from autogator.circuits import Circuit, CircuitMap, Location
+from autogator.errors import CircuitMapKeyError, CircuitMapUniqueKeyError
+
+
+@pytest.fixture
+def cmap():
+    return CircuitMap([
+        Circuit(Location(0, 0), {"name": "MZI1", "grouping": "1"}),
+        Circuit(Location(10, 0), {"name": "MZI2", "grouping": "1"}),
+        Circuit(Location(0, 20.5), {"name": "MZI3", "grouping": "2"}),
+    ])
 
 class TestLocation:
     def test_tostring(self):
@@ -15,13 +32,20 @@ class TestLocation:
         """
         Should fail. Tries ints, floats, strings, and lists.
         """
-        pass
+        for other in [1, 1.5, "ab", [1, 2]]:
+            with pytest.raises(TypeError):
+                Location(1, 2) + other
 
     def test_add_incorrect_types_tuple(self):
         """
         Should fail. Tries ints, floats, and strings.
         """
-        pass
+        for other in [(1,), (1, 2, 3), (1.5,), ("a", "b")]:
+            with pytest.raises(TypeError):
+                Location(1, 2) + other
+
+    def test_tuple_plus_location_concatenates(self):
+        assert (1, 2) + Location(3, 4) == (1, 2, 3, 4)
 
     def test_copy(self):
         pass
@@ -55,6 +79,22 @@ class TestCircuit:
     def test_deepcopy(self):
         pass
 
+    def test_tostring_after_params_edit(self):
+        circuit = Circuit(Location(1, 2), {"name": "MZI1", "grouping": "1"})
+        assert str(circuit) == "(1,2) name=MZI1, grouping=1"
+        circuit.params["name"] = "MZI2"
+        assert str(circuit) == "(1,2) name=MZI2, grouping=1"
+
+    def test_pickle(self):
+        circuit = Circuit(Location(1, 2), {"name": "MZI1"})
+        restored = pickle.loads(pickle.dumps(circuit))
+        assert restored.loc == circuit.loc
+        assert restored.params == circuit.params
+
+    def test_no_attribute_access_to_params(self):
+        circuit = Circuit(Location(1, 2), {"name": "MZI1"})
+        assert not hasattr(circuit, "name")
+
 
 class TestCircuitMap:
     def test_access_by_index(self):
@@ -98,3 +138,147 @@ class TestCircuitMap:
 
     def test_get_test_circuits(self):
         pass
+
+    def test_loadtxt_parses_locations_and_params(self, tmp_path):
+        path = tmp_path / "circuits.txt"
+        path.write_text(
+            "# comment\n"
+            "(0, 0) name=MZI1, grouping=1\n"
+            "\n"
+            "( 10.5 ,-2e1 )  name = ring with gap , gap=200 nm\n"
+            "(3,4)\n"
+        )
+        cmap = CircuitMap.loadtxt(path)
+        assert [c.loc for c in cmap.circuits] == [(0, 0), (10.5, -20), (3, 4)]
+        assert all(isinstance(c.loc, Location) for c in cmap.circuits)
+        assert cmap[0].params == {"name": "MZI1", "grouping": "1"}
+        assert cmap[1].params == {"name": "ring with gap", "gap": "200 nm"}
+        assert cmap[2].params == {}
+
+    def test_loadtxt_skips_malformed_lines(self, tmp_path, caplog):
+        path = tmp_path / "circuits.txt"
+        path.write_text("[\n(0, 0) name=MZI1\n(a, b) name=MZI2\nname=MZI3\n]\n")
+        with caplog.at_level(logging.WARNING, logger="autogator.circuits"):
+            cmap = CircuitMap.loadtxt(path)
+        assert len(cmap) == 1
+        assert cmap[0]["name"] == "MZI1"
+        assert len(caplog.records) == 4
+
+    def test_loadtxt_duplicate_location(self, tmp_path):
+        path = tmp_path / "circuits.txt"
+        path.write_text("(0, 0) name=MZI1\n# comment\n(0.0, 0) name=MZI2\n")
+        with pytest.raises(CircuitMapUniqueKeyError, match=r"\(0\.0, 0\.0\).*line 3"):
+            CircuitMap.loadtxt(path)
+
+    def test_add_maps_rebinds(self, cmap):
+        other = CircuitMap([
+            Circuit(Location(0, 0), {"name": "duplicate"}),
+            Circuit(Location(30, 0), {"name": "MZI4"}),
+        ])
+        alias = cmap
+        cmap += other
+        assert len(alias) == 3
+        assert len(cmap) == 4
+        assert cmap[(0, 0)]["name"] == "MZI1"
+
+    def test_default_circuits_not_shared(self):
+        first = CircuitMap()
+        first.circuits.append(Circuit(Location(0, 0), {}))
+        assert len(CircuitMap()) == 0
+
+    def test_savetxt_loadtxt_roundtrip(self, cmap, tmp_path):
+        path = tmp_path / "circuits.txt"
+        cmap.savetxt(path)
+        loaded = CircuitMap.loadtxt(path)
+        assert [c.loc for c in loaded.circuits] == [c.loc for c in cmap.circuits]
+        assert [c.params for c in loaded.circuits] == [c.params for c in cmap.circuits]
+
+    def test_translate(self, cmap):
+        cmap.translate(1.5, -2)
+        assert [c.loc for c in cmap.circuits] == [(1.5, -2), (11.5, -2), (1.5, 18.5)]
+        assert all(isinstance(c.loc, Location) for c in cmap.circuits)
+        assert cmap[(11.5, -2)]["name"] == "MZI2"
+
+    def test_translate_empty(self):
+        cmap = CircuitMap()
+        cmap.translate(1, 1)
+        assert len(cmap) == 0
+
+    def test_locations(self, cmap):
+        np.testing.assert_array_equal(cmap.locations, [[0, 0], [10, 0], [0, 20.5]])
+        assert CircuitMap().locations.shape == (0, 2)
+
+    def test_locations_is_snapshot(self, cmap):
+        locs = cmap.locations
+        locs += 1
+        assert cmap[0].loc == (0, 0)
+
+    def test_filterby_after_params_edit(self, cmap):
+        assert len(cmap.filterby(name="MZI1")) == 1
+        cmap[0].params["name"] = "MZI9"
+        assert len(cmap.filterby(name="MZI1")) == 0
+        assert cmap.filterby(name="MZI9")[0] is cmap[0]
+
+    def test_filterby_missing_key(self, cmap):
+        cmap[0].params["gap"] = "200"
+        assert [c["name"] for c in cmap.filterby(gap="200").circuits] == ["MZI1"]
+        assert len(cmap.filterby(gap="200", grouping="2")) == 0
+
+    def test_filterout_after_params_edit(self, cmap):
+        assert len(cmap.filterout(grouping="1")) == 1
+        cmap[0].params["grouping"] = "2"
+        assert [c["name"] for c in cmap.filterout(grouping="1").circuits] == ["MZI1", "MZI3"]
+
+    def test_savejson_loadjson(self, cmap, tmp_path):
+        path = tmp_path / "circuits.json"
+        cmap.savejson(path)
+        loaded = CircuitMap.loadjson(path)
+        assert len(loaded) == len(cmap)
+        for original, restored in zip(cmap.circuits, loaded.circuits):
+            assert restored.loc == original.loc
+            assert isinstance(restored.loc, Location)
+            assert restored.params == original.params
+
+    def test_savejson_matches_savetxt(self, cmap, tmp_path):
+        cmap.savejson(tmp_path / "circuits.json")
+        cmap.savetxt(tmp_path / "circuits.txt")
+        fromJson = CircuitMap.loadjson(tmp_path / "circuits.json")
+        fromTxt = CircuitMap.loadtxt(tmp_path / "circuits.txt")
+        assert [c.loc for c in fromJson.circuits] == [c.loc for c in fromTxt.circuits]
+        assert [c.params for c in fromJson.circuits] == [c.params for c in fromTxt.circuits]
+
+    def test_loadjson_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            CircuitMap.loadjson(tmp_path / "missing.json")
+
+    def test_loadjson_duplicate_location(self, tmp_path):
+        path = tmp_path / "circuits.json"
+        path.write_text('[[0, 0, {"name": "a"}], [0, 0, {"name": "b"}]]')
+        with pytest.raises(CircuitMapUniqueKeyError):
+            CircuitMap.loadjson(path)
+
+    def test_access_invalid_key_type(self, cmap):
+        with pytest.raises(TypeError):
+            cmap["MZI1"]
+
+    def test_access_by_numpy_index(self, cmap):
+        assert cmap[np.int64(1)] is cmap.circuits[1]
+
+    def test_slice(self, cmap):
+        sliced = cmap[1:]
+        assert isinstance(sliced, CircuitMap)
+        assert [c["name"] for c in sliced.circuits] == ["MZI2", "MZI3"]
+        sliced.circuits.pop()
+        assert len(cmap) == 3
+
+    def test_access_missing_location(self, cmap):
+        with pytest.raises(CircuitMapKeyError):
+            cmap[(5, 5)]
+
+    def test_access_by_location_after_replacing_circuit(self, cmap):
+        cmap[(0, 0)]
+        replacement = Circuit(Location(5, 5), {"name": "MZI4"})
+        cmap.circuits[0] = replacement
+        assert cmap[(5, 5)] is replacement
+        with pytest.raises(CircuitMapKeyError):
+            cmap[(0, 0)]
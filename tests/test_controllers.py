@@ -0,0 +1,92 @@
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+controllers = pytest.importorskip("autogator.controllers")
+
+
+class FakeKeyboard(types.ModuleType):
+    """
+    Stands in for the keyboard package. Combination bindings can't be
+    resolved to scan codes or given a release hook, like in the real one.
+    """
+    def __init__(self):
+        super().__init__("keyboard")
+        self.hotkeys = {}
+        self.held = set()
+
+    def add_hotkey(self, key, callback, args=()):
+        handle = object()
+        self.hotkeys[handle] = (key, callback, args)
+        return handle
+
+    def remove_hotkey(self, handle):
+        del self.hotkeys[handle]
+
+    def key_to_scan_codes(self, key):
+        if "+" in key:
+            raise ValueError(f"'{key}' is not a single key")
+        return (hash(key) % 256,)
+
+    def on_release_key(self, key, callback):
+        return object()
+
+    def unhook(self, handle):
+        pass
+
+    def is_pressed(self, key):
+        return key in self.held
+
+    def press(self, key):
+        self.held.add(key)
+        for bound, callback, args in list(self.hotkeys.values()):
+            if bound == key:
+                callback(*args)
+
+    def release(self, key):
+        self.held.discard(key)
+
+
+class FakeAxis:
+    def __init__(self):
+        self.moving = threading.Event()
+        self.stopped = threading.Event()
+
+    def move_cont(self, direction):
+        self.moving.set()
+
+    def stop(self):
+        self.stopped.set()
+
+
+@pytest.fixture
+def keyboard(monkeypatch):
+    fake = FakeKeyboard()
+    monkeypatch.setitem(sys.modules, "keyboard", fake)
+    return fake
+
+
+class TestKeyboardControl:
+    def test_combination_move_stops_soon_after_release(self, keyboard):
+        stage = types.SimpleNamespace(x=FakeAxis())
+        bindings = controllers.KeyloopKeyboardBindings(MOVE_LEFT="shift+a")
+        control = controllers.KeyboardControl(stage, bindings)
+        loop = threading.Thread(target=control.loop, daemon=True)
+        loop.start()
+        try:
+            deadline = time.monotonic() + 5
+            while "shift+a" not in [key for key, _, _ in keyboard.hotkeys.values()]:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            keyboard.press("shift+a")
+            assert stage.x.moving.wait(5)
+            released = time.monotonic()
+            keyboard.release("shift+a")
+            assert stage.x.stopped.wait(5)
+            assert time.monotonic() - released < 0.3
+        finally:
+            keyboard.press(bindings.QUIT)
+            loop.join(5)
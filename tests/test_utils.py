@@ -0,0 +1,11 @@
+import pytest
+
+utils = pytest.importorskip("autogator.utils")
+
+
+def test_write_atomic(tmp_path):
+    path = tmp_path / "profile.json"
+    utils.write_atomic(path, "first")
+    utils.write_atomic(path, "second")
+    assert path.read_text() == "second"
+    assert [p.name for p in tmp_path.iterdir()] == ["profile.json"]
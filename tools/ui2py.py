@@ -6,8 +6,9 @@
 # (see autogator/__init__.py for details)
 
 """
-Tool that converts all .ui and .qrc files in the autogator.resources folder to
-python files in autogator.compiled.
+Tool that converts all .ui and .qrc files in the autogator.resources folder,
+and the controller windows in the repository root, to python files in
+autogator.compiled.
 
 Usage:
 $ python3 ui2py.py
@@ -23,19 +24,24 @@ path = "autogator"
 res = os.path.join(path, "resources")
 dest = os.path.join(path, "compiled")
 
-for root, directories, filenames in os.walk(res):
-    for filename in filenames:
-        item = os.path.join(root, filename)
-        if item.endswith(".ui"):
-            name, _ = os.path.splitext(filename)
-            rename = name + "_ui" + ".py"
-            path2dest = os.path.join(dest, rename)
-            print(*["pyside2-uic", "--from-imports", item, "-o", path2dest])
-            subprocess.call(["pyside2-uic", "--from-imports", item, "-o", path2dest])
-        if item.endswith(".qrc"):
-            name, _ = os.path.splitext(filename)
-            rename = name + "_rc" + ".py"
-            path2dest = os.path.join(dest, rename)
-            args = ["pyside2-rcc", item, "-o", path2dest]
-            print(*args)
-            subprocess.call(args)
+os.makedirs(dest, exist_ok=True)
+
+items = [os.path.join(root, filename) for root, directories, filenames in os.walk(res) for filename in filenames]
+# Windows used by autogator.controllers
+items += [filename for filename in os.listdir(".") if filename.endswith(".ui")]
+
+for item in items:
+    filename = os.path.basename(item)
+    if item.endswith(".ui"):
+        name, _ = os.path.splitext(filename)
+        rename = name + "_ui" + ".py"
+        path2dest = os.path.join(dest, rename)
+        print(*["pyside6-uic", "--from-imports", item, "-o", path2dest])
+        subprocess.call(["pyside6-uic", "--from-imports", item, "-o", path2dest])
+    if item.endswith(".qrc"):
+        name, _ = os.path.splitext(filename)
+        rename = name + "_rc" + ".py"
+        path2dest = os.path.join(dest, rename)
+        args = ["pyside6-rcc", item, "-o", path2dest]
+        print(*args)
+        subprocess.call(args)